@@ -209,7 +209,7 @@ class TimeAxis(Parameter):
 
         npts = self.instrument.timetrace_npts()
         dt = self.instrument.timetrace_dt()
-        return np.linspace(0, dt * npts, npts, endpoint=False)
+        return np.arange(npts, dtype=np.float64) * dt
 
 
 class Keithley2600MeasurementStatus(StrEnum):
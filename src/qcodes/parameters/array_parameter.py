@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import collections.abc
-import os
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -197,7 +196,9 @@ class ArrayParameter(ParameterBase):
         self.setpoint_labels = setpoint_labels
         self.setpoint_units = setpoint_units
 
-        self.__doc__ = os.linesep.join(
+        # docstrings are always "\n"-separated in Python source,
+        # irrespective of the platform
+        self.__doc__ = "\n".join(
             (
                 "Parameter class:",
                 "",
@@ -209,7 +210,7 @@ class ArrayParameter(ParameterBase):
         )
 
         if docstring is not None:
-            self.__doc__ = os.linesep.join((docstring, "", self.__doc__))
+            self.__doc__ = "\n".join((docstring, "", self.__doc__))
 
         if not self.gettable and not self.settable:
             raise AttributeError("ArrayParameter must have a get, set or both")
@@ -6,6 +6,10 @@ from typing import TYPE_CHECKING, Protocol
 if TYPE_CHECKING:
     from .parameter_base import ParamDataType, ParameterBase, ParamRawDataType
 
+# ``_Cache._update_with`` runs on every parameter get and set; binding
+# ``datetime.now`` once avoids the repeated attribute lookup there
+_now = datetime.now
+
 
 # The protocol is private to qcodes but used elsewhere in the codebase
 class _CacheProtocol(Protocol):  # noqa: PYI046
@@ -164,7 +168,7 @@ class _Cache:
         self._value = value
         self._raw_value = raw_value
         if timestamp is None:
-            self._timestamp = datetime.now()
+            self._timestamp = _now()
         else:
             self._timestamp = timestamp
         self._marked_valid = True
@@ -176,9 +180,7 @@ class _Cache:
         if self._max_val_age is None:
             # parameter cannot expire
             return False
-        oldest_accepted_timestamp = datetime.now() - timedelta(
-            seconds=self._max_val_age
-        )
+        oldest_accepted_timestamp = _now() - timedelta(seconds=self._max_val_age)
         if self._timestamp < oldest_accepted_timestamp:
             # Time of last get exceeds max_val_age seconds, need to
             # perform new .get()
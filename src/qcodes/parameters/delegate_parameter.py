@@ -51,9 +51,19 @@ class DelegateParameter(Parameter):
 
     """
 
+    __slots__ = ("_source", "_label_override", "_unit_override")
+
     class _DelegateCache:
+        __slots__ = ("_parameter", "_source_cache", "_marked_valid")
+
         def __init__(self, parameter: DelegateParameter):
             self._parameter = parameter
+            # mirror of ``parameter.source.cache`` (or ``None`` without a
+            # source), kept up to date by the ``source`` setter so that
+            # every access does not have to walk ``self._parameter.source``
+            # and re-check it against ``None``
+            source = parameter.source
+            self._source_cache = source.cache if source is not None else None
             self._marked_valid: bool = False
 
         @property
@@ -69,61 +79,70 @@ class DelegateParameter(Parameter):
             This bug will not be fixed since the `raw_value` property will be
             removed soon.
             """
-            if self._parameter.source is None:
+            source_cache = self._source_cache
+            if source_cache is None:
                 raise TypeError(
                     "Cannot get the raw value of a "
                     "DelegateParameter that delegates to None"
                 )
-            return self._parameter.source.cache.get(get_if_invalid=False)
+            return source_cache.get(get_if_invalid=False)
 
         @property
         def max_val_age(self) -> float | None:
-            if self._parameter.source is None:
+            source_cache = self._source_cache
+            if source_cache is None:
                 return None
-            return self._parameter.source.cache.max_val_age
+            return source_cache.max_val_age
 
         @property
         def timestamp(self) -> datetime | None:
-            if self._parameter.source is None:
+            source_cache = self._source_cache
+            if source_cache is None:
                 return None
-            return self._parameter.source.cache.timestamp
+            return source_cache.timestamp
 
         @property
         def valid(self) -> bool:
-            if self._parameter.source is None:
+            source_cache = self._source_cache
+            if source_cache is None:
                 return False
-            source_cache = self._parameter.source.cache
             return source_cache.valid
 
         def invalidate(self) -> None:
-            if self._parameter.source is not None:
-                self._parameter.source.cache.invalidate()
+            source_cache = self._source_cache
+            if source_cache is not None:
+                source_cache.invalidate()
 
         def get(self, get_if_invalid: bool = True) -> ParamDataType:
-            if self._parameter.source is None:
+            source_cache = self._source_cache
+            if source_cache is None:
                 raise TypeError(
                     "Cannot get the cache of a DelegateParameter that delegates to None"
                 )
-            return self._parameter._from_raw_value_to_value(
-                self._parameter.source.cache.get(get_if_invalid=get_if_invalid)
-            )
+            parameter = self._parameter
+            raw_value = source_cache.get(get_if_invalid=get_if_invalid)
+            if parameter._has_get_transform:
+                return parameter._from_raw_value_to_value(raw_value)
+            # the common case: the delegate does not transform the
+            # source value, so skip the conversion chain entirely
+            return raw_value
 
         def set(self, value: ParamDataType) -> None:
-            if self._parameter.source is None:
+            source_cache = self._source_cache
+            if source_cache is None:
                 raise TypeError(
                     "Cannot set the cache of a DelegateParameter that delegates to None"
                 )
             self._parameter.validate(value)
-            self._parameter.source.cache.set(
-                self._parameter._from_value_to_raw_value(value)
-            )
+            source_cache.set(self._parameter._from_value_to_raw_value(value))
 
         def _set_from_raw_value(self, raw_value: ParamRawDataType) -> None:
-            if self._parameter.source is None:
+            source_cache = self._source_cache
+            if source_cache is None:
                 raise TypeError(
                     "Cannot set the cache of a DelegateParameter that delegates to None"
                 )
-            self._parameter.source.cache.set(raw_value)
+            source_cache.set(raw_value)
 
         def _update_with(
             self,
@@ -174,8 +193,14 @@ class DelegateParameter(Parameter):
         initial_cache_value = kwargs.pop("initial_cache_value", None)
         self.source = source
         super().__init__(name, *args, **kwargs)
-        self.label = kwargs.get("label", None)
-        self.unit = kwargs.get("unit", None)
+        # ``Parameter.__init__`` routed ``label``/``unit`` through the
+        # property setters, so the overrides already hold any explicitly
+        # given values; only the plain-parameter defaults it wrote need to
+        # be reset to ``None``, meaning "inherit from source"
+        if kwargs.get("label") is None:
+            self._label_override = None
+        if kwargs.get("unit") is None:
+            self._unit_override = None
 
         # Hack While we inherit the settable status from the parent parameter
         # we do allow param.set_to to temporary override _settable in a
@@ -201,6 +226,11 @@ class DelegateParameter(Parameter):
     @source.setter
     def source(self, source: Parameter | None) -> None:
         self._source: Parameter | None = source
+        # keep the cached source-cache reference in sync; during
+        # ``__init__`` the source is assigned before the cache exists
+        cache = getattr(self, "cache", None)
+        if isinstance(cache, DelegateParameter._DelegateCache):
+            cache._source_cache = source.cache if source is not None else None
 
     @property
     def snapshot_value(self) -> bool:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import os
 from collections.abc import Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
@@ -208,19 +207,21 @@ class MultiParameter(ParameterBase):
         self.setpoint_labels = setpoint_labels
         self.setpoint_units = setpoint_units
 
-        self.__doc__ = os.linesep.join(
+        # docstrings are always "\n"-separated in Python source,
+        # irrespective of the platform
+        self.__doc__ = "\n".join(
             (
                 "MultiParameter class:",
                 "",
                 f"* `name` {self.name}",
-                "* `names` {}".format(", ".join(self.names)),
-                "* `labels` {}".format(", ".join(self.labels)),
-                "* `units` {}".format(", ".join(self.units)),
+                f"* `names` {', '.join(self.names)}",
+                f"* `labels` {', '.join(self.labels)}",
+                f"* `units` {', '.join(self.units)}",
             )
         )
 
         if docstring is not None:
-            self.__doc__ = os.linesep.join((docstring, "", self.__doc__))
+            self.__doc__ = "\n".join((docstring, "", self.__doc__))
 
         if not self.gettable and not self.settable:
             raise AttributeError("MultiParameter must have a get, set or both")
@@ -3,12 +3,12 @@
 # if everyone is happy to use these classes.
 from __future__ import annotations
 
-import logging
-import os
+import sys
 from types import MethodType
 from typing import TYPE_CHECKING, Any, Literal
 
-from .command import Command
+from qcodes.utils import is_function
+
 from .parameter_base import ParamDataType, ParameterBase, ParamRawDataType
 from .sweep_values import SweepFixedValues
 
@@ -16,11 +16,59 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
     from qcodes.instrument.base import InstrumentBase
-    from qcodes.logger.instrument_logger import InstrumentLoggerAdapter
     from qcodes.validators import Validator
 
 
-log = logging.getLogger(__name__)
+class _LazyDocstring:
+    """
+    Descriptor serving ``__doc__`` for :class:`Parameter` instances.
+
+    Building the generated docstring for every parameter at construction
+    time is a pure allocation cost when instruments create many parameters,
+    while ``__doc__`` is rarely read at runtime. This descriptor builds the
+    docstring on first access and memoizes it on the instance. Accessed on
+    the class it returns the class docstring, so ``help()`` and the api
+    docs are unaffected.
+    """
+
+    def __get__(
+        self, instance: Parameter | None, owner: type[Parameter] | None = None
+    ) -> str | None:
+        if instance is None:
+            assert owner is not None
+            return owner._class_docstring
+        doc = instance._doc_cache
+        if doc is None:
+            doc = instance._build__doc__()
+            instance._doc_cache = doc
+        return doc
+
+    def __set__(self, instance: Parameter, value: str | None) -> None:
+        instance._doc_cache = value
+
+
+def _get_manual_parameter(self: Parameter) -> ParamRawDataType:
+    mylogger = self._get_logger()
+    mylogger.debug(
+        "Getting raw value of parameter: %s as %s",
+        self.full_name,
+        self.cache.raw_value,
+    )
+    return self.cache.raw_value
+
+
+def _set_manual_parameter(self: Parameter, x: ParamRawDataType) -> ParamRawDataType:
+    mylogger = self._get_logger()
+    mylogger.debug("Setting raw value of parameter: %s to %s", self.full_name, x)
+    self.cache._set_from_raw_value(x)
+    return x
+
+
+def _install_lazy_docstring(cls: type[Parameter]) -> None:
+    # preserve the class docstring before shadowing ``__doc__`` with the
+    # descriptor so that access on the class keeps returning it
+    cls._class_docstring = cls.__dict__.get("__doc__")
+    cls.__doc__ = _LazyDocstring()  # type: ignore[assignment]
 
 
 class Parameter(ParameterBase):
@@ -168,6 +216,34 @@ class Parameter(ParameterBase):
 
     """
 
+    # Store the attributes that every instance sets in slots. Instruments
+    # commonly create hundreds to thousands of parameters, and slot access
+    # is both faster and more compact than a dict probe on the hot
+    # ``get``/``set``/``cache`` paths. ``ParameterBase`` does not define
+    # ``__slots__`` so instances still carry a ``__dict__`` (and
+    # ``__weakref__``) for all remaining attributes; this keeps dynamic
+    # attribute assignment on parameters working as before.
+    _class_docstring: str | None
+
+    #: Label of the data used for plots etc.
+    label: str
+    #: The unit of measure. Use ``''`` (the empty string) for unitless.
+    unit: str
+
+    __slots__ = (
+        "label",
+        "unit",
+        "_docstring",
+        "_doc_cache",
+        "_gettable",
+        "_settable",
+        "cache",
+        "get",
+        "set",
+        "get_raw",
+        "set_raw",
+    )
+
     def __init__(
         self,
         name: str,
@@ -184,32 +260,8 @@ class Parameter(ParameterBase):
         bind_to_instrument: bool = True,
         **kwargs: Any,
     ) -> None:
-        def _get_manual_parameter(self: Parameter) -> ParamRawDataType:
-            if self.root_instrument is not None:
-                mylogger: InstrumentLoggerAdapter | logging.Logger = (
-                    self.root_instrument.log
-                )
-            else:
-                mylogger = log
-            mylogger.debug(
-                "Getting raw value of parameter: %s as %s",
-                self.full_name,
-                self.cache.raw_value,
-            )
-            return self.cache.raw_value
-
-        def _set_manual_parameter(
-            self: Parameter, x: ParamRawDataType
-        ) -> ParamRawDataType:
-            mylogger = self._get_logger()
-            mylogger.debug(
-                "Setting raw value of parameter: %s to %s", self.full_name, x
-            )
-            self.cache._set_from_raw_value(x)
-            return x
-
         if instrument is not None and bind_to_instrument:
-            existing_parameter = instrument.parameters.get(name, None)
+            existing_parameter = instrument.parameters.get(name)
 
             if existing_parameter:
                 # this check is redundant since its also in the baseclass
@@ -224,7 +276,9 @@ class Parameter(ParameterBase):
                     )
 
                 existing_unit = getattr(existing_parameter, "unit", None)
-                if existing_unit != unit:
+                # units are interned, so matching units are normally the
+                # same object and the equality check can be skipped
+                if existing_unit is not unit and existing_unit != unit:
                     raise ValueError(
                         f"The unit of the parameter '{name}' is '{unit}'. "
                         f"This is inconsistent with the unit defined in the "
@@ -240,7 +294,12 @@ class Parameter(ParameterBase):
             **kwargs,
         )
 
-        no_instrument_get = not self._implements_get_raw and (
+        # evaluate the _implements_* properties once; they perform a
+        # hasattr plus getattr each time and are consulted repeatedly below
+        implements_get_raw = self._implements_get_raw
+        implements_set_raw = self._implements_set_raw
+
+        no_instrument_get = not implements_get_raw and (
             get_cmd is None or get_cmd is False
         )
         # TODO: a matching check should be in ParameterBase but
@@ -258,75 +317,110 @@ class Parameter(ParameterBase):
         # in the scope of this class.
         # (previous call to `super().__init__` wraps existing
         # get_raw/set_raw into get/set methods)
-        if self._implements_get_raw and get_cmd not in (None, False):
+        if implements_get_raw and get_cmd not in (None, False):
             raise TypeError(
                 "Supplying a not None or False `get_cmd` to a Parameter"
                 " that already implements"
                 " get_raw is an error."
             )
-        elif not self._implements_get_raw and get_cmd is not False:
+        elif not implements_get_raw and get_cmd is not False:
             if get_cmd is None:
                 # ignore typeerror since mypy does not allow setting a method dynamically
                 self.get_raw = MethodType(_get_manual_parameter, self)  # type: ignore[method-assign]
-            else:
-                if isinstance(get_cmd, str) and instrument is None:
+            elif isinstance(get_cmd, str):
+                if instrument is None:
                     raise TypeError(
                         f"Cannot use a str get_cmd without "
                         f"binding to an instrument. "
                         f"Got: get_cmd {get_cmd} for parameter {name}"
                     )
 
-                exec_str_ask = getattr(instrument, "ask", None) if instrument else None
-                # TODO get_raw should also be a method here. This should probably be done by wrapping
-                # it with MethodType like above
+                exec_str_ask = getattr(instrument, "ask", None)
+                if exec_str_ask is None:
+                    raise TypeError("exec_str cannot be None if cmd is a str.")
+
+                # specialize the command into a direct closure so that
+                # every get does not pay for ``Command.__call__`` dispatch;
+                # the command string and transport are captured as closure
+                # variables so that, like the old ``Command``, stray
+                # arguments passed to ``get`` raise a ``TypeError`` instead
+                # of reaching the instrument
+                get_cmd_str: str = get_cmd
+
+                def _ask_get_raw() -> ParamRawDataType:
+                    return exec_str_ask(get_cmd_str.format())
+
+                # ignore typeerror since mypy does not allow setting a method dynamically
+                self.get_raw = _ask_get_raw  # type: ignore[method-assign]
+            elif is_function(get_cmd, 0):
+                # the callable can be used as ``get_raw`` directly
                 # ignore typeerror since mypy does not allow setting a method dynamically
-                self.get_raw = Command(  # type: ignore[method-assign]
-                    arg_count=0,
-                    cmd=get_cmd,
-                    exec_str=exec_str_ask,
+                self.get_raw = get_cmd  # type: ignore[method-assign]
+            else:
+                raise TypeError(
+                    "get_cmd must be a string or function with arg_count=0 args"
                 )
             self._gettable = True
             # mypy resolves the type of self.get_raw to object here.
-            # this may be resolvable if Command above is correctly wrapped in MethodType
             self.get = self._wrap_get(self.get_raw)  # type: ignore[arg-type]
 
-        if self._implements_set_raw and set_cmd not in (None, False):
+        manual_set = False
+        if implements_set_raw and set_cmd not in (None, False):
             raise TypeError(
                 "Supplying a not None or False `set_cmd` to a Parameter"
                 " that already implements"
                 " set_raw is an error."
             )
-        elif not self._implements_set_raw and set_cmd is not False:
+        elif not implements_set_raw and set_cmd is not False:
             if set_cmd is None:
+                manual_set = True
                 # ignore typeerror since mypy does not allow setting a method dynamically
                 self.set_raw = MethodType(_set_manual_parameter, self)  # type: ignore[method-assign]
-            else:
-                if isinstance(set_cmd, str) and instrument is None:
+            elif isinstance(set_cmd, str):
+                if instrument is None:
                     raise TypeError(
                         f"Cannot use a str set_cmd without "
                         f"binding to an instrument. "
                         f"Got: set_cmd {set_cmd} for parameter {name}"
                     )
 
-                exec_str_write = (
-                    getattr(instrument, "write", None) if instrument else None
-                )
-                # TODO get_raw should also be a method here. This should probably be done by wrapping
-                # it with MethodType like above
+                exec_str_write = getattr(instrument, "write", None)
+                if exec_str_write is None:
+                    raise TypeError("exec_str cannot be None if cmd is a str.")
+
+                # specialize the command into a direct closure so that
+                # every set does not pay for ``Command.__call__`` dispatch;
+                # as for the get closure above, capture the command string
+                # and transport as closure variables so the function takes
+                # exactly one argument
+                set_cmd_str: str = set_cmd
+
+                def _write_set_raw(value: ParamRawDataType) -> Any:
+                    return exec_str_write(set_cmd_str.format(value))
+
+                # ignore typeerror since mypy does not allow setting a method dynamically
+                self.set_raw = _write_set_raw  # type: ignore[assignment]
+            elif is_function(set_cmd, 1):
+                # the callable can be used as ``set_raw`` directly
                 # ignore typeerror since mypy does not allow setting a method dynamically
-                self.set_raw = Command(  # type: ignore[assignment]
-                    arg_count=1, cmd=set_cmd, exec_str=exec_str_write
+                self.set_raw = set_cmd  # type: ignore[assignment]
+            else:
+                raise TypeError(
+                    "set_cmd must be a string or function with arg_count=1 args"
                 )
             self._settable = True
             self.set = self._wrap_set(self.set_raw)
 
-        self._meta_attrs.extend(["label", "unit", "vals"])
+        self._meta_attrs.extend(("label", "unit", "vals"))
 
-        self.label = name if label is None else label
-        self._label: str
+        # ``label`` and ``unit`` are plain slot attributes; intern them here
+        # so the handful of distinct label/unit strings ("V", "A", ...) are
+        # shared across the thousands of parameters that carry them
+        label = name if label is None else label
+        self.label = sys.intern(label) if isinstance(label, str) else label
 
-        self.unit = unit if unit is not None else ""
-        self._unitval: str
+        unit = unit if unit is not None else ""
+        self.unit = sys.intern(unit) if isinstance(unit, str) else unit
 
         if initial_value is not None and initial_cache_value is not None:
             raise SyntaxError(
@@ -336,13 +430,33 @@ class Parameter(ParameterBase):
             )
 
         if initial_value is not None:
-            self.set(initial_value)
+            if (
+                manual_set
+                and self._step is None
+                and self._inter_delay == 0
+                and self._post_delay == 0
+                and self.on_set_callback is None
+                and self.__class__.global_on_set_callback is None
+            ):
+                # for a manual parameter without stepping, delays or
+                # callbacks, setting only updates the cache; write the
+                # cache directly instead of going through the full set
+                # machinery (validation and scaling still apply)
+                self.cache.set(initial_value)
+            else:
+                self.set(initial_value)
 
         if initial_cache_value is not None:
             self.cache.set(initial_cache_value)
 
         self._docstring = docstring
-        self.__doc__ = self._build__doc__()
+        # the docstring served via ``__doc__`` is built lazily on first
+        # access by ``_LazyDocstring`` and memoized here
+        self._doc_cache: str | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _install_lazy_docstring(cls)
 
     def _build__doc__(self) -> str:
         if len(self.validators) == 0:
@@ -351,8 +465,9 @@ class Parameter(ParameterBase):
             validator_docstrings = [
                 f"* `vals` {validator!r}" for validator in self.validators
             ]
-        # generate default docstring
-        doc = os.linesep.join(
+        # generate default docstring; docstrings are always "\n"-separated
+        # in Python source, irrespective of the platform
+        doc = "\n".join(
             (
                 "Parameter class:",
                 "",
@@ -363,33 +478,10 @@ class Parameter(ParameterBase):
             )
         )
         if self._docstring is not None:
-            doc = os.linesep.join((self._docstring, "", doc))
+            doc = "\n".join((self._docstring, "", doc))
 
         return doc
 
-    @property
-    def unit(self) -> str:
-        """
-        The unit of measure. Use ``''`` (the empty string)
-        for unitless.
-        """
-        return self._unitval
-
-    @unit.setter
-    def unit(self, unit: str) -> None:
-        self._unitval = unit
-
-    @property
-    def label(self) -> str:
-        """
-        Label of the data used for plots etc.
-        """
-        return self._label
-
-    @label.setter
-    def label(self, label: str) -> None:
-        self._label = label
-
     def __getitem__(self, keys: Any) -> SweepFixedValues:
         """
         Slice a Parameter to get a SweepValues object
@@ -440,6 +532,11 @@ class Parameter(ParameterBase):
         return SweepFixedValues(self, start=start, stop=stop, step=step, num=num)
 
 
+# ``__init_subclass__`` only runs for subclasses; install the lazy
+# docstring descriptor on ``Parameter`` itself explicitly
+_install_lazy_docstring(Parameter)
+
+
 class ManualParameter(Parameter):
     def __init__(
         self,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import collections.abc
 import logging
+import sys
 import time
 import warnings
 from contextlib import contextmanager
@@ -196,6 +197,22 @@ class ParameterBase(MetadatableWithName):
         Callable[[ParameterBase, ParamDataType], None] | None
     ] = None
 
+    # attributes every parameter includes in its snapshot; the per-instance
+    # ``_meta_attrs`` list is seeded from this shared tuple so that the
+    # literal is not rebuilt for every parameter constructed
+    _BASE_META_ATTRS: ClassVar[tuple[str, ...]] = (
+        "name",
+        "instrument",
+        "step",
+        "scale",
+        "offset",
+        "inter_delay",
+        "post_delay",
+        "val_mapping",
+        "vals",
+        "validators",
+    )
+
     def __init__(
         self,
         name: str,
@@ -227,7 +244,9 @@ class ParameterBase(MetadatableWithName):
                 f"cannot start with a number and "
                 f"must not contain spaces or special characters"
             )
-        self._short_name = str(name)
+        # interning collapses the many identical name strings created
+        # when instantiating large numbers of parameters
+        self._short_name = sys.intern(str(name))
         self._register_name = register_name
         self._instrument = instrument
         self._snapshot_get = snapshot_get
@@ -271,10 +290,12 @@ class ParameterBase(MetadatableWithName):
         self.get_latest = GetLatest(self)
 
         self.get: Callable[..., ParamDataType]
-        self._gettable = False
-        if self._implements_get_raw:
+        # evaluate the _implements_* properties once; they perform a
+        # hasattr plus getattr each time
+        implements_get_raw = self._implements_get_raw
+        self._gettable = implements_get_raw
+        if implements_get_raw:
             self.get = self._wrap_get(self.get_raw)
-            self._gettable = True
         elif hasattr(self, "get"):
             raise RuntimeError(
                 f"Overwriting get in a subclass of "
@@ -283,10 +304,10 @@ class ParameterBase(MetadatableWithName):
             )
 
         self.set: Callable[..., None]
-        self._settable: bool = False
-        if self._implements_set_raw:
+        implements_set_raw = self._implements_set_raw
+        self._settable: bool = implements_set_raw
+        if implements_set_raw:
             self.set = self._wrap_set(self.set_raw)
-            self._settable = True
         elif hasattr(self, "set"):
             raise RuntimeError(
                 f"Overwriting set in a subclass of "
@@ -296,18 +317,7 @@ class ParameterBase(MetadatableWithName):
 
         # subclasses should extend this list with extra attributes they
         # want automatically included in the snapshot
-        self._meta_attrs = [
-            "name",
-            "instrument",
-            "step",
-            "scale",
-            "offset",
-            "inter_delay",
-            "post_delay",
-            "val_mapping",
-            "vals",
-            "validators",
-        ]
+        self._meta_attrs = list(self._BASE_META_ATTRS)
 
         # Specify time of last set operation, used when comparing to delay to
         # check if additional waiting time is needed before next set
@@ -319,7 +329,7 @@ class ParameterBase(MetadatableWithName):
         self._abstract = abstract
 
         if instrument is not None and bind_to_instrument:
-            found_as_delegate = instrument.parameters.get(name, False)
+            existing_parameter = instrument.parameters.get(name)
             # we allow properties since a pattern that has been seen in the wild
             # is properties that are used to wrap parameters of the same name
             # to define an interface for the instrument
@@ -328,9 +338,7 @@ class ParameterBase(MetadatableWithName):
             )
             found_as_attr = not is_property and hasattr(instrument, name)
 
-            if found_as_delegate or found_as_attr:
-                existing_parameter = instrument.parameters.get(name, None)
-
+            if existing_parameter is not None or found_as_attr:
                 if existing_parameter is not None and not existing_parameter.abstract:
                     raise KeyError(
                         f"Duplicate parameter name {name} on instrument {instrument}"
@@ -618,6 +626,36 @@ class ParameterBase(MetadatableWithName):
         """
         return self._snapshot_value
 
+    @property
+    def _has_set_transform(self) -> bool:
+        """
+        Whether ``_from_value_to_raw_value`` would transform the value.
+        Must stay in sync with the attributes that method consults; checked
+        per call since val_mapping, scale, offset and set_parser are all
+        mutable after init.
+        """
+        return (
+            self.val_mapping is not None
+            or self.scale is not None
+            or self.offset is not None
+            or self.set_parser is not None
+        )
+
+    @property
+    def _has_get_transform(self) -> bool:
+        """
+        Whether ``_from_raw_value_to_value`` would transform the raw value.
+        Must stay in sync with the attributes that method consults; checked
+        per call since get_parser, offset, scale and inverse_val_mapping are
+        all mutable after init.
+        """
+        return (
+            self.get_parser is not None
+            or self.offset is not None
+            or self.scale is not None
+            or self.inverse_val_mapping is not None
+        )
+
     def _from_value_to_raw_value(self, value: ParamDataType) -> ParamRawDataType:
         raw_value: ParamRawDataType
 
@@ -722,7 +760,12 @@ class ParameterBase(MetadatableWithName):
                 # There might be cases where a .get also has args/kwargs
                 raw_value = get_function(*args, **kwargs)
 
-                value = self._from_raw_value_to_value(raw_value)
+                # with no parser, offset, scale or val_mapping the raw value
+                # is the value, so skip the conversion chain entirely
+                if self._has_get_transform:
+                    value = self._from_raw_value_to_value(raw_value)
+                else:
+                    value = raw_value
 
                 if self._validate_on_get:
                     self.validate(value)
@@ -759,7 +802,12 @@ class ParameterBase(MetadatableWithName):
                     # steps that are not so validate them too
                     self.validate(val_step)
 
-                    raw_val_step = self._from_value_to_raw_value(val_step)
+                    # with no val_mapping, scale, offset or parser the value
+                    # is the raw value, so skip the conversion chain entirely
+                    if self._has_set_transform:
+                        raw_val_step = self._from_value_to_raw_value(val_step)
+                    else:
+                        raw_val_step = val_step
 
                     # Check if delay between set operations is required
                     t_elapsed = time.perf_counter() - self._t_last_set
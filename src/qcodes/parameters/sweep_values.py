@@ -137,12 +137,11 @@ class SweepValues(Metadatable):
 
         # allow has_set=False to override the existence of a set method,
         # but don't require it to be present (and truthy) otherwise
-        if not (
-            getattr(parameter, "set", None) and getattr(parameter, "has_set", True)
-        ):
+        parameter_set = getattr(parameter, "set", None)
+        if not (parameter_set and getattr(parameter, "has_set", True)):
             raise TypeError(f"parameter {parameter} is not settable")
 
-        self.set = parameter.set
+        self.set = parameter_set
 
     def validate(self, values: Sequence[Any]) -> None:
         """
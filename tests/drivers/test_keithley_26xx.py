@@ -1,5 +1,3 @@
-from collections import Counter
-
 import numpy as np
 import pytest
 
@@ -21,8 +19,8 @@ def _make_driver():
 
 @pytest.fixture(scope="function", name="smus")
 def _make_smus(driver):
-    smu_names = {"smua", "smub"}
-    assert smu_names == set(list(driver.submodules.keys()))
+    smu_names = ("smua", "smub")
+    assert set(smu_names) == driver.submodules.keys()
 
     yield tuple(getattr(driver, smu_name) for smu_name in smu_names)
 
@@ -36,143 +34,145 @@ def test_idn(driver) -> None:
     } == driver.IDN()
 
 
-def test_smu_channels_and_their_parameters(driver) -> None:
-    assert {"smua", "smub"} == set(list(driver.submodules.keys()))
-
-    for smu_name in ("smua", "smub"):
-        smu = getattr(driver, smu_name)
-
-        smu.volt(1.0)
-        assert smu.volt.measurement_status is None
-
-        assert 1.0 == smu.volt()
-        assert smu.volt.measurement_status == Keithley2600MeasurementStatus.NORMAL
-
-        smu.curr(1.0)
-        assert smu.volt.measurement_status is None
-
-        assert 1.0 == smu.curr()
-        assert smu.curr.measurement_status == Keithley2600MeasurementStatus.NORMAL
+@pytest.mark.parametrize("smu_name", ["smua", "smub"])
+def test_smu_channels_and_their_parameters(driver, smu_name) -> None:
+    assert {"smua", "smub"} == driver.submodules.keys()
 
-        assert 0.0 == smu.res()
+    smu = getattr(driver, smu_name)
+    some_valid_vrange = driver._vranges[smu.model][2]
+    some_valid_irange = driver._iranges[smu.model][2]
 
-        assert "current" == smu.mode()
-        smu.mode("voltage")
-        assert smu.mode() == "voltage"
+    volt = smu.volt
+    curr = smu.curr
 
-        assert smu.output() is False
-        smu.output(True)
-        assert smu.output() is True
+    volt(1.0)
+    assert volt.measurement_status is None
 
-        assert 0.0 == smu.nplc()
-        smu.nplc(2.3)
-        assert smu.nplc() == 2.3
+    assert 1.0 == volt()
+    assert volt.measurement_status == Keithley2600MeasurementStatus.NORMAL
 
-        assert 0.0 == smu.sourcerange_v()
-        some_valid_sourcerange_v = driver._vranges[smu.model][2]
-        smu.sourcerange_v(some_valid_sourcerange_v)
-        assert smu.sourcerange_v() == some_valid_sourcerange_v
-
-        assert smu.source_autorange_v_enabled() is False
-        smu.source_autorange_v_enabled(True)
-        assert smu.source_autorange_v_enabled() is True
-
-        assert 0.0 == smu.measurerange_v()
-        some_valid_measurerange_v = driver._vranges[smu.model][2]
-        smu.measurerange_v(some_valid_measurerange_v)
-        assert smu.measurerange_v() == some_valid_measurerange_v
-
-        assert smu.measure_autorange_v_enabled() is False
-        smu.measure_autorange_v_enabled(True)
-        assert smu.measure_autorange_v_enabled() is True
+    curr(1.0)
+    assert volt.measurement_status is None
 
-        assert 0.0 == smu.sourcerange_i()
-        some_valid_sourcerange_i = driver._iranges[smu.model][2]
-        smu.sourcerange_i(some_valid_sourcerange_i)
-        assert smu.sourcerange_i() == some_valid_sourcerange_i
+    assert 1.0 == curr()
+    assert curr.measurement_status == Keithley2600MeasurementStatus.NORMAL
 
-        assert smu.source_autorange_i_enabled() is False
-        smu.source_autorange_i_enabled(True)
-        assert smu.source_autorange_i_enabled() is True
+    assert 0.0 == smu.res()
 
-        assert 0.0 == smu.measurerange_i()
-        some_valid_measurerange_i = driver._iranges[smu.model][2]
-        smu.measurerange_i(some_valid_measurerange_i)
-        assert smu.measurerange_i() == some_valid_measurerange_i
-
-        assert smu.measure_autorange_i_enabled() is False
-        smu.measure_autorange_i_enabled(True)
-        assert smu.measure_autorange_i_enabled() is True
-
-        assert 0.0 == smu.limitv()
-        smu.limitv(2.3)
-        assert smu.limitv() == 2.3
-
-        assert 0.0 == smu.limiti()
-        smu.limiti(2.3)
-        assert smu.limiti() == 2.3
-
-        assert "current" == smu.timetrace_mode()
-        smu.timetrace_mode("voltage")
-        assert smu.timetrace_mode() == "voltage"
-
-        assert 500 == smu.timetrace_npts()
-        smu.timetrace_npts(600)
-        assert smu.timetrace_npts() == 600
-
-        assert 0.001 == smu.timetrace_dt()
-        smu.timetrace_dt(0.002)
-        assert smu.timetrace_dt() == 0.002
-
-        dt = smu.timetrace_dt()
-        npts = smu.timetrace_npts()
-        expected_time_axis = np.linspace(0, dt * npts, npts, endpoint=False)
-        assert len(expected_time_axis) == len(smu.time_axis())
-        assert Counter(expected_time_axis) == Counter(smu.time_axis())
-        assert set(expected_time_axis) == set(smu.time_axis())
-
-        smu.timetrace_mode("current")
-        assert "A" == smu.timetrace.unit
-        assert "Current" == smu.timetrace.label
-        assert smu.time_axis == smu.timetrace.setpoints[0]
-
-        smu.timetrace_mode("voltage")
-        assert "V" == smu.timetrace.unit
-        assert "Voltage" == smu.timetrace.label
-        assert smu.time_axis == smu.timetrace.setpoints[0]
+    # parameters that follow a plain "assert default, set, read back"
+    # round trip: (parameter name, default value, new value)
+    round_trips = (
+        ("mode", "current", "voltage"),
+        ("output", False, True),
+        ("nplc", 0.0, 2.3),
+        ("limitv", 0.0, 2.3),
+        ("limiti", 0.0, 2.3),
+        ("timetrace_mode", "current", "voltage"),
+        ("timetrace_npts", 500, 600),
+        ("timetrace_dt", 0.001, 0.002),
+    )
+    for param_name, default_value, new_value in round_trips:
+        param = getattr(smu, param_name)
+        assert param() == default_value
+        param(new_value)
+        assert param() == new_value
+
+    sourcerange_v = smu.sourcerange_v
+    assert 0.0 == sourcerange_v()
+    sourcerange_v(some_valid_vrange)
+    assert sourcerange_v() == some_valid_vrange
+
+    source_autorange_v_enabled = smu.source_autorange_v_enabled
+    assert source_autorange_v_enabled() is False
+    source_autorange_v_enabled(True)
+    assert source_autorange_v_enabled() is True
+
+    measurerange_v = smu.measurerange_v
+    assert 0.0 == measurerange_v()
+    measurerange_v(some_valid_vrange)
+    assert measurerange_v() == some_valid_vrange
+
+    measure_autorange_v_enabled = smu.measure_autorange_v_enabled
+    assert measure_autorange_v_enabled() is False
+    measure_autorange_v_enabled(True)
+    assert measure_autorange_v_enabled() is True
+
+    sourcerange_i = smu.sourcerange_i
+    assert 0.0 == sourcerange_i()
+    sourcerange_i(some_valid_irange)
+    assert sourcerange_i() == some_valid_irange
+
+    source_autorange_i_enabled = smu.source_autorange_i_enabled
+    assert source_autorange_i_enabled() is False
+    source_autorange_i_enabled(True)
+    assert source_autorange_i_enabled() is True
+
+    measurerange_i = smu.measurerange_i
+    assert 0.0 == measurerange_i()
+    measurerange_i(some_valid_irange)
+    assert measurerange_i() == some_valid_irange
+
+    measure_autorange_i_enabled = smu.measure_autorange_i_enabled
+    assert measure_autorange_i_enabled() is False
+    measure_autorange_i_enabled(True)
+    assert measure_autorange_i_enabled() is True
+
+    timetrace_mode = smu.timetrace_mode
+    timetrace = smu.timetrace
+    time_axis = smu.time_axis
+
+    dt = smu.timetrace_dt()
+    npts = smu.timetrace_npts()
+    expected_time_axis = np.arange(npts, dtype=np.float64) * dt
+    actual_time_axis = time_axis()
+    np.testing.assert_array_equal(expected_time_axis, actual_time_axis)
+
+    timetrace_mode("current")
+    assert "A" == timetrace.unit
+    assert "Current" == timetrace.label
+    assert time_axis is timetrace.setpoints[0]
+
+    timetrace_mode("voltage")
+    assert "V" == timetrace.unit
+    assert "Voltage" == timetrace.label
+    assert time_axis is timetrace.setpoints[0]
 
 
 def test_setting_source_voltage_range_disables_autorange(smus) -> None:
+    some_valid_sourcerange_v = smus[0].root_instrument._vranges[smus[0].model][2]
     for smu in smus:
-        smu.source_autorange_v_enabled(True)
-        assert smu.source_autorange_v_enabled() is True
-        some_valid_sourcerange_v = smu.root_instrument._vranges[smu.model][2]
+        source_autorange_v_enabled = smu.source_autorange_v_enabled
+        source_autorange_v_enabled(True)
+        assert source_autorange_v_enabled() is True
         smu.sourcerange_v(some_valid_sourcerange_v)
-        assert smu.source_autorange_v_enabled() is False
+        assert source_autorange_v_enabled() is False
 
 
 def test_setting_measure_voltage_range_disables_autorange(smus) -> None:
+    some_valid_measurerange_v = smus[0].root_instrument._vranges[smus[0].model][2]
     for smu in smus:
-        smu.measure_autorange_v_enabled(True)
-        assert smu.measure_autorange_v_enabled() is True
-        some_valid_measurerange_v = smu.root_instrument._vranges[smu.model][2]
+        measure_autorange_v_enabled = smu.measure_autorange_v_enabled
+        measure_autorange_v_enabled(True)
+        assert measure_autorange_v_enabled() is True
         smu.measurerange_v(some_valid_measurerange_v)
-        assert smu.measure_autorange_v_enabled() is False
+        assert measure_autorange_v_enabled() is False
 
 
 def test_setting_source_current_range_disables_autorange(smus) -> None:
+    some_valid_sourcerange_i = smus[0].root_instrument._iranges[smus[0].model][2]
     for smu in smus:
-        smu.source_autorange_i_enabled(True)
-        assert smu.source_autorange_i_enabled() is True
-        some_valid_sourcerange_i = smu.root_instrument._iranges[smu.model][2]
+        source_autorange_i_enabled = smu.source_autorange_i_enabled
+        source_autorange_i_enabled(True)
+        assert source_autorange_i_enabled() is True
         smu.sourcerange_i(some_valid_sourcerange_i)
-        assert smu.source_autorange_i_enabled() is False
+        assert source_autorange_i_enabled() is False
 
 
 def test_setting_measure_current_range_disables_autorange(smus) -> None:
+    some_valid_measurerange_i = smus[0].root_instrument._iranges[smus[0].model][2]
     for smu in smus:
-        smu.measure_autorange_i_enabled(True)
-        assert smu.measure_autorange_i_enabled() is True
-        some_valid_measurerange_i = smu.root_instrument._iranges[smu.model][2]
+        measure_autorange_i_enabled = smu.measure_autorange_i_enabled
+        measure_autorange_i_enabled(True)
+        assert measure_autorange_i_enabled() is True
         smu.measurerange_i(some_valid_measurerange_i)
-        assert smu.measure_autorange_i_enabled() is False
+        assert measure_autorange_i_enabled() is False
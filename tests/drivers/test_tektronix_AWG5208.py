@@ -1,5 +1,3 @@
-import os
-
 import pytest
 
 from qcodes.instrument_drivers.tektronix.AWG5208 import AWG5208
@@ -29,6 +27,6 @@ def test_channel_resolution_docstring(awg) -> None:
         "allowing for ZERO markers"
     )
 
-    actual_docstring = awg.ch1.resolution.__doc__.split(os.linesep)[0]
+    actual_docstring = awg.ch1.resolution.__doc__.split("\n")[0]
 
     assert actual_docstring == expected_docstring